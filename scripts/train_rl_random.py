@@ -23,6 +23,12 @@ from utttrlsim.env import UltimateTicTacToeEnv
 from utttrlsim.policies import random_policy
 from utttrlsim.wrappers import SelfPlayWrapper
 
+# libyaml があれば C 実装のローダーを使い、なければ純 Python 版にフォールバック
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # プロジェクトルートをパスに追加
 # project_root = pathlib.Path(__file__).parent.parent
 # sys.path.insert(0, str(project_root / "src"))
@@ -38,6 +44,29 @@ def mask_fn(env):
     return env.get_action_mask()
 
 
+class RotatingCheckpointCallback(CheckpointCallback):
+    """保存のたびに古いチェックポイントを削除し、最新 keep_last 個だけ残す"""
+
+    def __init__(self, *args, keep_last: int = 2, **kwargs):
+        # 0 だと全件残り、負の値だと最新のものから削除されてしまう
+        if keep_last < 1:
+            raise ValueError(f"keep_last は 1 以上にしてください: {keep_last}")
+        super().__init__(*args, **kwargs)
+        self.keep_last = keep_last
+
+    def _on_step(self) -> bool:
+        result = super()._on_step()
+        if self.n_calls % self.save_freq == 0:
+            # ファイル名は {name_prefix}_{steps}_steps.zip なのでステップ数で並べる
+            checkpoints = sorted(
+                pathlib.Path(self.save_path).glob(f"{self.name_prefix}_*_steps.zip"),
+                key=lambda path: int(path.stem.split("_")[-2]),
+            )
+            for old_checkpoint in checkpoints[: -self.keep_last]:
+                old_checkpoint.unlink()
+        return result
+
+
 def make_env(env_id: str, agent_piece: Player, opponent_seed: int = None, rank: int = 0):
     """
     並列環境用の環境作成関数
@@ -52,6 +81,10 @@ def make_env(env_id: str, agent_piece: Player, opponent_seed: int = None, rank:
         作成された環境
     """
     def _init():
+        # ワーカープロセスは環境を動かすだけなので、torch のスレッドを
+        # コア数ぶん立ち上げて学習プロセスと CPU を奪い合わないようにする
+        torch.set_num_threads(1)
+
         # 基本環境を作成
         base_env = UltimateTicTacToeEnv()
         
@@ -76,7 +109,7 @@ def main():
     config_path = "config.yaml"
 
     with open(config_path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f)
+        cfg = yaml.load(f, Loader=YamlLoader)
 
     # Random対戦版の設定を取得
     random_cfg = cfg.get("random_training", {})
@@ -103,10 +136,16 @@ def main():
     opponent_seed = random_cfg.get("opponent_seed", 42)
 
     # SubprocVecEnvで並列環境を作成
-    env = SubprocVecEnv([
-        make_env("UTTTRLSim-v0", agent_piece, opponent_seed, i) 
-        for i in range(n_envs)
-    ])
+    # Linux では起動の速い fork を使う（CUDA 初期化前なので安全）。
+    # macOS / Windows では fork が安全でないため spawn を使う
+    start_method = "fork" if sys.platform.startswith("linux") else "spawn"
+    env = SubprocVecEnv(
+        [
+            make_env("UTTTRLSim-v0", agent_piece, opponent_seed, i)
+            for i in range(n_envs)
+        ],
+        start_method=start_method,
+    )
 
     # デバイス選択 (Apple Silicon対応)
     if torch.cuda.is_available():
@@ -139,12 +178,22 @@ def main():
     # --- コールバック設定 ---
     # 基本設定からtotal_stepsを取得
     total_steps = cfg["total_steps"]
-    checkpoint_freq = max(1, total_steps // 10)
-
-    checkpoint_callback = CheckpointCallback(
+    # checkpoint_freq は従来どおり save_freq の単位（コールバック呼び出し回数）。
+    # 未指定なら従来の total_steps // 10 より間隔を広げ、保存回数を減らす
+    checkpoint_freq = cfg.get("checkpoint_freq")
+    if checkpoint_freq is None:
+        checkpoint_freq = max(1, total_steps // 3)
+    elif checkpoint_freq < 1:
+        raise ValueError(f"checkpoint_freq は 1 以上にしてください: {checkpoint_freq}")
+    checkpoint_keep = cfg.get("checkpoint_keep", 2)
+
+    checkpoint_callback = RotatingCheckpointCallback(
         save_freq=checkpoint_freq,
         save_path=model_dir,
         name_prefix="uttt_rl_random_model",
+        save_replay_buffer=False,
+        save_vecnormalize=False,
+        keep_last=checkpoint_keep,
     )
 
     # --- 評価コールバック設定 ---
@@ -15,21 +15,42 @@ Ultimate Tic-Tac-Toe Rules:
 8. If all sub-boards are full or won and no player has won 3 in a row, the game is a draw
 """
 
-import itertools
-from enum import Enum
-from typing import List, Optional, Set, Tuple
+from enum import IntEnum
+from typing import List, NamedTuple, Optional, Set, Tuple
 
 import numpy as np
 
 
-class Player(Enum):
-    """Player enumeration for Ultimate Tic-Tac-Toe"""
+class Player(IntEnum):
+    """
+    Player enumeration for Ultimate Tic-Tac-Toe.
+
+    Members are ints equal to their cell value in the 9x9 board array, so
+    they can be compared with or written into the array without `.value`.
+    """
 
     EMPTY = 0
     X = 1
     O = 2
 
 
+# Plain int player values for hot paths (enum attribute access is slow)
+_EMPTY, _X, _O = Player.EMPTY.value, Player.X.value, Player.O.value
+
+# Player enum members indexed by value
+_PLAYERS = (Player.EMPTY, Player.X, Player.O)
+
+# Coordinate lookup tables indexed by global position ID (0-80)
+_BOARD_X = tuple(i % 9 for i in range(81))
+_BOARD_Y = tuple(i // 9 for i in range(81))
+_SUB_GRID_X = tuple(x // 3 for x in _BOARD_X)
+_SUB_GRID_Y = tuple(y // 3 for y in _BOARD_Y)
+_SUB_GRID_ID = tuple(x + y * 3 for x, y in zip(_SUB_GRID_X, _SUB_GRID_Y))
+_CELL_X = tuple(x % 3 for x in _BOARD_X)
+_CELL_Y = tuple(y % 3 for y in _BOARD_Y)
+_CELL_ID = tuple(x + y * 3 for x, y in zip(_CELL_X, _CELL_Y))
+
+
 class Position:
     """
     Position class for Ultimate Tic-Tac-Toe board coordinates.
@@ -39,11 +60,36 @@ class Position:
     - Position(grid_x, grid_y, cell_x, cell_y): Grid and cell coordinates
         - grid_x, grid_y: Sub-grid coordinates (0-2)
         - cell_x, cell_y: Cell coordinates within sub-grid (0-2)
+
+    All coordinates are read from precomputed lookup tables once, when the
+    81 interned instances are created at import. Positions are immutable and
+    interned, so constructing the same position twice returns the same
+    instance.
+
+    Attributes:
+        board_id: Board position ID (0-80)
+        board_x, board_y: Coordinates (0-8) in the 9x9 main board
+        sub_grid_x, sub_grid_y: Which 3x3 sub-grid (0-2) horizontally/vertically
+        sub_grid_id: Unique identifier (0-8) for the 3x3 sub-grid
+        cell_x, cell_y: Coordinates (0-2) within the 3x3 sub-grid
+        cell_id: Cell ID (0-8) within the sub-grid
     """
 
-    def __init__(self, *args):
+    __slots__ = (
+        "board_id",
+        "board_x",
+        "board_y",
+        "sub_grid_x",
+        "sub_grid_y",
+        "sub_grid_id",
+        "cell_x",
+        "cell_y",
+        "cell_id",
+    )
+
+    def __new__(cls, *args):
         """
-        Initialize position.
+        Return the interned position.
 
         Args:
             Either:
@@ -56,82 +102,184 @@ class Position:
             # Initialize from global ID
             board_id = args[0]
             assert 0 <= board_id < 81, f"Position ID must be 0-80, got {board_id}"
-            self._id = board_id
-        elif len(args) == 4:
-            # Initialize from grid and cell coordinates
-            grid_x, grid_y, cell_x, cell_y = args
-            assert 0 <= grid_x < 3, f"Grid X coordinate must be 0-2, got {grid_x}"
-            assert 0 <= grid_y < 3, f"Grid Y coordinate must be 0-2, got {grid_y}"
-            assert 0 <= cell_x < 3, f"Cell X coordinate must be 0-2, got {cell_x}"
-            assert 0 <= cell_y < 3, f"Cell Y coordinate must be 0-2, got {cell_y}"
-            self._id = (grid_x * 3 + cell_x) + (grid_y * 3 + cell_y) * 9
-        else:
-            raise ValueError(
-                "Position requires either 1 argument (global_id) or 4 arguments (grid_x, grid_y, cell_x, cell_y)"
-            )
-
-    @property
-    def board_id(self) -> int:
-        """Board position ID (0-80)."""
-        return self._id
-
-    @property
-    def board_x(self) -> int:
-        """Board X coordinate (0-8) - position in the 9x9 main board."""
-        return self._id % 9
+            return _ALL_POSITIONS[board_id]
+        if len(args) == 4:
+            # Initialize from grid and cell coordinates; _grid_to_id already
+            # validates them, so the resulting ID is always in range
+            return _ALL_POSITIONS[cls._grid_to_id(*args)]
+        raise ValueError(
+            "Position requires either 1 argument (global_id) or 4 arguments (grid_x, grid_y, cell_x, cell_y)"
+        )
 
-    @property
-    def board_y(self) -> int:
-        """Board Y coordinate (0-8) - position in the 9x9 main board."""
-        return self._id // 9
+    @classmethod
+    def _create(cls, board_id: int) -> "Position":
+        """Allocate a new instance; only used to build the interning table."""
+        position = object.__new__(cls)
+        for name, table in (
+            ("board_id", range(81)),
+            ("board_x", _BOARD_X),
+            ("board_y", _BOARD_Y),
+            ("sub_grid_x", _SUB_GRID_X),
+            ("sub_grid_y", _SUB_GRID_Y),
+            ("sub_grid_id", _SUB_GRID_ID),
+            ("cell_x", _CELL_X),
+            ("cell_y", _CELL_Y),
+            ("cell_id", _CELL_ID),
+        ):
+            object.__setattr__(position, name, table[board_id])
+        return position
+
+    @classmethod
+    def from_grid(
+        cls, grid_x: int, grid_y: int, cell_x: int, cell_y: int
+    ) -> "Position":
+        """
+        Create a position from grid and cell coordinates.
 
-    @property
-    def sub_grid_x(self) -> int:
-        """Sub-grid X coordinate (0-2) - which 3x3 sub-grid horizontally."""
-        return self.board_x // 3
+        Args:
+            grid_x, grid_y: Sub-grid coordinates (0-2)
+            cell_x, cell_y: Cell coordinates within sub-grid (0-2)
 
-    @property
-    def sub_grid_y(self) -> int:
-        """Sub-grid Y coordinate (0-2) - which 3x3 sub-grid vertically."""
-        return self.board_y // 3
+        Returns:
+            Position at the given coordinates
+        """
+        return _ALL_POSITIONS[cls._grid_to_id(grid_x, grid_y, cell_x, cell_y)]
 
-    @property
-    def sub_grid_id(self) -> int:
-        """Sub-grid ID (0-8) - unique identifier for the 3x3 sub-grid."""
-        return self.sub_grid_x + self.sub_grid_y * 3
+    @staticmethod
+    def _grid_to_id(grid_x: int, grid_y: int, cell_x: int, cell_y: int) -> int:
+        """Convert grid and cell coordinates to a global position ID."""
+        assert 0 <= grid_x < 3, f"Grid X coordinate must be 0-2, got {grid_x}"
+        assert 0 <= grid_y < 3, f"Grid Y coordinate must be 0-2, got {grid_y}"
+        assert 0 <= cell_x < 3, f"Cell X coordinate must be 0-2, got {cell_x}"
+        assert 0 <= cell_y < 3, f"Cell Y coordinate must be 0-2, got {cell_y}"
+        return (grid_x * 3 + cell_x) + (grid_y * 3 + cell_y) * 9
 
-    @property
-    def cell_x(self) -> int:
-        """Cell X coordinate within sub-grid (0-2) - position within the 3x3 sub-grid."""
-        return self.board_x % 3
+    def __setattr__(self, name, value):
+        raise AttributeError("Position is immutable")
 
-    @property
-    def cell_y(self) -> int:
-        """Cell Y coordinate within sub-grid (0-2) - position within the 3x3 sub-grid."""
-        return self.board_y % 3
+    def __delattr__(self, name):
+        raise AttributeError("Position is immutable")
 
-    @property
-    def cell_id(self) -> int:
-        """Cell ID within sub-grid (0-8)."""
-        return self.cell_x + self.cell_y * 3
+    def __reduce__(self):
+        return (Position, (self.board_id,))
 
     def __eq__(self, other):
         if isinstance(other, Position):
-            return self._id == other._id
+            return self.board_id == other.board_id
         return False
 
     def __hash__(self):
-        return hash(self._id)
+        # Small ints hash to themselves, so the ID is used as the hash directly
+        return self.board_id
 
     def __repr__(self):
-        return f"Position(board_id={self._id}, board=({self.board_x}, {self.board_y}), sub_grid=({self.sub_grid_x}, {self.sub_grid_y}), cell=({self.cell_x}, {self.cell_y}))"
+        return f"Position(board_id={self.board_id}, board=({self.board_x}, {self.board_y}), sub_grid=({self.sub_grid_x}, {self.sub_grid_y}), cell=({self.cell_x}, {self.cell_y}))"
+
+
+# Interned instances for all 81 positions
+_ALL_POSITIONS = tuple(Position._create(i) for i in range(81))
+
+# Zobrist keys: one per (player value, position ID), plus keys for the side
+# to move and for the cell of the last move (which selects the target sub-board)
+_ZOBRIST_RNG = np.random.default_rng(0)
+_ZOBRIST = tuple(
+    tuple(int(key) for key in row)
+    for row in _ZOBRIST_RNG.integers(1 << 63, size=(3, 81), dtype=np.uint64)
+)
+_ZOBRIST_TURN = int(_ZOBRIST_RNG.integers(1 << 63, dtype=np.uint64))
+_ZOBRIST_TARGET = tuple(
+    int(key) for key in _ZOBRIST_RNG.integers(1 << 63, size=9, dtype=np.uint64)
+)
+
+# Bitboards hold one bit per cell, ordered sub-board by sub-board
+# (bit = sub_grid_id * 9 + cell_id) so each sub-board is a contiguous 9-bit run
+_SLOT = tuple(sub * 9 + cell for sub, cell in zip(_SUB_GRID_ID, _CELL_ID))
+_SLOT_POSITIONS = tuple(
+    _ALL_POSITIONS[board_id] for board_id in sorted(range(81), key=_SLOT.__getitem__)
+)
+_SLOT_INDEX = np.array(_SLOT, dtype=np.intp)
+
+# _ID_BITS[sub][field]: the 9-bit field of sub-board `sub` re-laid out with
+# bit = board ID, so legal moves can be listed in ascending board ID order
+_ID_BITS = tuple(
+    tuple(
+        sum(
+            1 << _SLOT_POSITIONS[sub * 9 + cell].board_id
+            for cell in range(9)
+            if (field >> cell) & 1
+        )
+        for field in range(512)
+    )
+    for sub in range(9)
+)
+_ALL_CELLS = (1 << 81) - 1
+_SUB_MASKS = tuple(0x1FF << (9 * sub) for sub in range(9))
+
+# Cells of all sub-boards that are still open, indexed by the 9-bit mask of
+# closed (won or full) sub-boards
+_OPEN_CELLS = tuple(
+    sum(_SUB_MASKS[sub] for sub in range(9) if not (closed >> sub) & 1)
+    for closed in range(512)
+)
+
+# Three-in-a-row patterns on a 9-bit cell mask (bit = cell_x + cell_y * 3)
+_WIN_PATTERNS = (0o007, 0o070, 0o700, 0o111, 0o222, 0o444, 0o421, 0o124)
+
+# 1 if the 9-bit cell mask contains a three-in-a-row, else 0
+_WIN_TABLE = bytes(
+    any(mask & pattern == pattern for pattern in _WIN_PATTERNS) for mask in range(512)
+)
+
+# Bit weights for packing nine cells (or nine sub-boards) into a 9-bit mask
+_BIT_WEIGHTS = 1 << np.arange(9, dtype=np.int64)
+
+# _WIN_TABLE as a boolean array, for looking up many masks at once
+_WIN_LUT = np.frombuffer(_WIN_TABLE, dtype=np.uint8).astype(bool)
+
+# Row m holds the nine bits of the 9-bit mask m, for expanding sub-board masks
+_MASK_BITS = ((np.arange(512)[:, None] >> np.arange(9)) & 1).astype(np.int8)
+
+
+def _unpack_bits(bits: int) -> np.ndarray:
+    """
+    Expand a bitboard into a per-position array.
+
+    Args:
+        bits: Bitboard (bit = sub_grid_id * 9 + cell_id)
+
+    Returns:
+        uint8 array of length 81 indexed by global position ID (1 = bit set)
+    """
+    packed = np.frombuffer(bits.to_bytes(11, "little"), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder="little")[_SLOT_INDEX]
+
+
+class BoardSnapshot(NamedTuple):
+    """
+    Minimal, immutable record of a board state.
+
+    Everything else (sub-board winners, game result, Zobrist hash) is derived
+    from these fields when the snapshot is restored.
+
+    Attributes:
+        x_bits, o_bits: Per-player bitboards (bit = sub_grid_id * 9 + cell_id)
+        current_player: Player to move
+        last_move: Board ID (0-80) of the last move, or None before the first
+    """
+
+    x_bits: int
+    o_bits: int
+    current_player: Player
+    last_move: Optional[int]
 
 
 class UltimateTicTacToeBoard:
     """
     Ultimate Tic-Tac-Toe board implementation.
 
-    Board representation: 9x9 numpy array where:
+    Board representation: one 81-bit integer bitboard per player, with one
+    bit per cell ordered sub-board by sub-board. The `board` property
+    materializes it as a 9x9 numpy array where:
     - 0: Empty
     - 1: Player X
     - 2: Player O
@@ -146,31 +294,99 @@ class UltimateTicTacToeBoard:
         last_move: Optional[Position] = None,
     ):
         """Initialize an empty Ultimate Tic-Tac-Toe board."""
-        # Main board: 9x9 grid
-        if board is None:
-            board = np.full((9, 9), Player.EMPTY.value, dtype=np.int8)
-        self._board: np.ndarray = board
-
-        # Current player (1 for X, 2 for O)
-        self._current_player: Player = current_player
+        # Current player value (1 for X, 2 for O)
+        self._current_player: int = current_player.value
 
         # Last move made (Position object)
         self._last_move: Optional[Position] = last_move
 
+        # Per-player bitboards and the 9-bit mask of sub-boards that are won
+        # or full; make_move updates them incrementally
+        self._x_bits: int = 0
+        self._o_bits: int = 0
+        self._closed: int = 0
+
+        # 9-bit masks of sub-boards won by each player (bit = sub_grid_id),
+        # and the cached game result
+        self._subwin_x: int = 0
+        self._subwin_o: int = 0
+        self._game_over: bool = False
+        self._winner: int = _EMPTY
+
+        # Zobrist hash of the current state, updated incrementally by make_move
+        self._zobrist: int = 0
+        if board is None:
+            self._zobrist = self._compute_zobrist()
+        else:
+            self._rebuild_state(board)
+
+        # Legal moves of the current state; cleared whenever the state changes.
+        # On an empty board before the first move every cell is legal
+        self._legal_cache: Optional[Tuple[Position, ...]] = (
+            _ALL_POSITIONS if board is None and last_move is None else None
+        )
+        # Read-only array of their IDs, built on demand and cleared with them
+        self._legal_ids_cache: Optional[np.ndarray] = None
+
+        # Last materialized (read-only) 9x9 array and rendering, keyed
+        # by the bitboards they were built from
+        self._board_cache: Optional[Tuple[int, int, np.ndarray]] = None
+        self._render_cache: Optional[Tuple[int, int, Tuple[str, ...], str]] = None
+
     @property
     def board(self) -> np.ndarray:
-        return self._board.copy()
+        """Get the 9x9 board array (a new array on every access)."""
+        return self.board_view.copy()
+
+    @property
+    def board_view(self) -> np.ndarray:
+        """
+        Get the 9x9 board array as a shared, read-only array.
+
+        The array is never modified in place; a new one is built after the
+        board changes, so it stays a valid snapshot for as long as it is held.
+        """
+        # Unpack the bitboards only when a stone has been placed since the
+        # last access
+        cache = self._board_cache
+        if cache is not None and cache[0] == self._x_bits and cache[1] == self._o_bits:
+            return cache[2]
+
+        cells = _unpack_bits(self._x_bits) * _X + _unpack_bits(self._o_bits) * _O
+        # Cell values are 0-2, so the uint8 bytes are reinterpreted as int8
+        # rather than converted. Backing the array with immutable bytes means
+        # holders cannot setflags(write=True) and modify the shared cache.
+        board = np.frombuffer(cells.tobytes(), dtype=np.int8).reshape(9, 9)
+        self._board_cache = (self._x_bits, self._o_bits, board)
+        return board
+
+    @board.setter
+    def board(self, board: np.ndarray) -> None:
+        """Replace all cells, keeping the current player and last move."""
+        self._rebuild_state(board)
 
     @property
     def current_player(self) -> Player:
         """Get the current player."""
-        return self._current_player
+        return _PLAYERS[self._current_player]
 
     @property
     def last_move(self) -> Optional[Position]:
         """Get the last move made."""
         return self._last_move
 
+    @property
+    def zobrist(self) -> int:
+        """
+        Zobrist hash of the current state.
+
+        Covers cell contents, the player to move and the last move's cell
+        (which determines the target sub-board), so equal states hash equally
+        regardless of the move order that produced them. Use it, not the
+        mutable board itself, as a transposition-table key.
+        """
+        return self._zobrist
+
     def make_move(self, position: Position) -> None:
         """
         Make a move on the board.
@@ -186,23 +402,80 @@ class UltimateTicTacToeBoard:
         if self.game_over:
             raise RuntimeError("Cannot make move: game is already over")
 
-        legal_moves = self.get_legal_moves()
-        if position not in legal_moves:
+        if not self.is_legal_move(position):
+            legal_moves = self.get_legal_moves()
             raise ValueError(
                 f"Invalid move: position {position} is not in legal moves. "
                 f"Legal moves: {legal_moves}"
             )
 
-        # Make the move
-        self._board[position.board_y, position.board_x] = self._current_player.value
+        self._apply(position.board_id)
+
+    def make_move_unchecked(self, board_id: int) -> None:
+        """
+        Make a move without validating it.
+
+        Intended for search code that only plays moves obtained from
+        get_legal_moves(). Passing an illegal move, or moving after the game
+        is over, leaves the board in an inconsistent state.
+
+        Args:
+            board_id: Global position ID (0-80) of a legal move
+        """
+        self._apply(board_id)
+
+    def _apply(self, board_id: int) -> None:
+        """
+        Place the current player's stone and update all derived state.
+
+        Args:
+            board_id: Global position ID (0-80), assumed to be legal
+        """
+        player_value = self._current_player
+
+        # Update Zobrist hash: new stone, side to move, and target sub-board
+        zobrist = self._zobrist ^ _ZOBRIST[player_value][board_id] ^ _ZOBRIST_TURN
+        if self._last_move is not None:
+            zobrist ^= _ZOBRIST_TARGET[self._last_move.cell_id]
+        self._zobrist = zobrist ^ _ZOBRIST_TARGET[_CELL_ID[board_id]]
+
+        # Update bitboards, then only the sub-board the move landed in
+        bit = 1 << _SLOT[board_id]
+        if player_value == _X:
+            self._x_bits |= bit
+            own_bits = self._x_bits
+        else:
+            self._o_bits |= bit
+            own_bits = self._o_bits
+        sub = _SUB_GRID_ID[board_id]
+        shift = 9 * sub
+        if _WIN_TABLE[(own_bits >> shift) & 0x1FF]:
+            self._closed |= 1 << sub
+
+            # Only a newly won sub-board can complete a meta-board line
+            if player_value == _X:
+                self._subwin_x |= 1 << sub
+                own_meta = self._subwin_x
+            else:
+                self._subwin_o |= 1 << sub
+                own_meta = self._subwin_o
+            if _WIN_TABLE[own_meta]:
+                self._game_over = True
+                self._winner = player_value
+        elif ((self._x_bits | self._o_bits) >> shift) & 0x1FF == 0x1FF:
+            self._closed |= 1 << sub
+
+        # All sub-boards won or full → draw (unless the move above won)
+        if self._closed == 0x1FF:
+            self._game_over = True
 
         # Update last move
-        self._last_move = position
+        self._last_move = _ALL_POSITIONS[board_id]
+        self._legal_cache = None
+        self._legal_ids_cache = None
 
         # Switch players
-        self._current_player = (
-            Player.O if self._current_player == Player.X else Player.X
-        )
+        self._current_player = _O if player_value == _X else _X
 
     def get_legal_moves(self) -> List[Position]:
         """
@@ -214,68 +487,76 @@ class UltimateTicTacToeBoard:
         3. If the target sub-board is full or already won, can play in any available sub-board
 
         Returns:
-            List of Position objects representing legal moves.
+            List of Position objects representing legal moves, in ascending
+            board ID order.
+        """
+        if self._legal_cache is None:
+            # Re-lay the legal bitboard out by board ID, one sub-board at a
+            # time, so the moves come out in ascending ID order
+            legal_bits = self._legal_bits()
+            id_bits = 0
+            for sub in range(9):
+                field = (legal_bits >> (9 * sub)) & 0x1FF
+                if field:
+                    id_bits |= _ID_BITS[sub][field]
+
+            # Collect empty allowed cells by iterating over set bits
+            legal_moves = []
+            while id_bits:
+                low_bit = id_bits & -id_bits
+                legal_moves.append(_ALL_POSITIONS[low_bit.bit_length() - 1])
+                id_bits ^= low_bit
+            self._legal_cache = tuple(legal_moves)
+
+        # Callers get their own list so they cannot modify the cache
+        return list(self._legal_cache)
+
+    def get_legal_move_ids(self) -> np.ndarray:
         """
-        legal_moves = set()
+        Get the global IDs of all legal moves without creating Positions.
 
-        if self._last_move is None:
-            # First move: can play anywhere
-            # Assert that board is completely empty for first move
-            assert np.all(self._board == 0), "Board must be empty for first move"
+        Returns:
+            Ascending int8 array of legal position IDs (0-80)
+        """
+        if self._legal_ids_cache is None:
+            legal_ids = np.flatnonzero(self._legal_id_mask()).astype(np.int8)
+            legal_ids.setflags(write=False)
+            self._legal_ids_cache = legal_ids
 
-            # All 81 positions are legal for first move
-            for pos_id in range(81):
-                pos = Position(pos_id)
-                legal_moves.add(pos)
-        else:
-            # Subsequent moves: must play in the sub-board corresponding to last move's cell position
-            target_sub_grid_x = self._last_move.cell_x
-            target_sub_grid_y = self._last_move.cell_y
-
-            # Check if target sub-board is available (not won and not full)
-            target_sub_board_available = self.subboard_winner[
-                target_sub_grid_y, target_sub_grid_x
-            ] == Player.EMPTY.value and not self._is_sub_board_full(
-                target_sub_grid_x, target_sub_grid_y
-            )
+        # Callers get their own array so they cannot modify the cache
+        return self._legal_ids_cache.copy()
 
-            if target_sub_board_available:
-                # Must play in target sub-board
-                for cell_id in range(9):
-                    cell = Position(
-                        target_sub_grid_x, target_sub_grid_y, cell_id % 3, cell_id // 3
-                    )
-                    if self._board[cell.board_y, cell.board_x] == Player.EMPTY.value:
-                        legal_moves.add(cell)
-            else:
-                # Target sub-board is won or full, can play in any available sub-board
-                for sub_grid_x, sub_grid_y in itertools.product(range(3), range(3)):
-                    # Skip sub-boards that are won or full
-                    if self.subboard_winner[
-                        sub_grid_y, sub_grid_x
-                    ] != Player.EMPTY.value or self._is_sub_board_full(
-                        sub_grid_x, sub_grid_y
-                    ):
-                        continue
-
-                    # Add all empty cells in this available sub-board
-                    for cell_id in range(9):
-                        cell = Position(
-                            sub_grid_x, sub_grid_y, cell_id % 3, cell_id // 3
-                        )
-                        if (
-                            self._board[cell.board_y, cell.board_x]
-                            == Player.EMPTY.value
-                        ):
-                            legal_moves.add(cell)
-
-        return list(legal_moves)
+    def is_legal_move(self, position: Position) -> bool:
+        """
+        Check whether a position is among get_legal_moves(), in O(1).
+
+        Args:
+            position: Position to check
+
+        Returns:
+            True if the current player may play at the position
+        """
+        # Anything that is not a Position is never a legal move, as with
+        # `position in get_legal_moves()`; make_move then raises ValueError
+        if not isinstance(position, Position):
+            return False
+        return bool((self._legal_bits() >> _SLOT[position.board_id]) & 1)
 
     def reset(self, current_player: Player = Player.X) -> None:
         """Reset the board to initial state."""
-        self._board.fill(Player.EMPTY.value)
-        self._current_player = current_player
+        self._current_player = current_player.value
         self._last_move = None
+        self._x_bits = 0
+        self._o_bits = 0
+        # Hash after clearing the bitboards: only the side to move remains
+        self._zobrist = self._compute_zobrist()
+        self._closed = 0
+        self._subwin_x = 0
+        self._subwin_o = 0
+        self._game_over = False
+        self._winner = _EMPTY
+        self._legal_cache = _ALL_POSITIONS
+        self._legal_ids_cache = None
 
     def render(self) -> str:
         """
@@ -284,6 +565,25 @@ class UltimateTicTacToeBoard:
         Returns:
             String representation of the board with sub-boards separated by lines
         """
+        return self._render()[3]
+
+    def render_lines(self) -> List[str]:
+        """
+        Render the board as a list of display lines, without joining them.
+
+        Returns:
+            The 11 lines of render(): 9 cell rows and 2 separator lines
+        """
+        return list(self._render()[2])
+
+    def _render(self) -> Tuple[int, int, Tuple[str, ...], str]:
+        """Return the cached rendering, rebuilding it after board changes."""
+        # Reuse the previous rendering while no stone has been placed since
+        cache = self._render_cache
+        if cache is not None and cache[0] == self._x_bits and cache[1] == self._o_bits:
+            return cache
+
+        cells = self.board_view.tolist()
         result = []
 
         for meta_row in range(3):
@@ -291,8 +591,8 @@ class UltimateTicTacToeBoard:
                 line = ""
                 for meta_col in range(3):
                     for sub_col in range(3):
-                        pos = Position(meta_col, meta_row, sub_col, sub_row)
-                        cell = self._board[pos.board_y, pos.board_x]
+                        pos = Position.from_grid(meta_col, meta_row, sub_col, sub_row)
+                        cell = cells[pos.board_y][pos.board_x]
 
                         if cell == Player.EMPTY.value:
                             line += "."
@@ -312,16 +612,76 @@ class UltimateTicTacToeBoard:
             if meta_row < 2:
                 result.append("-" * 23)
 
-        return "\n".join(result)
+        self._render_cache = (
+            self._x_bits,
+            self._o_bits,
+            tuple(result),
+            "\n".join(result),
+        )
+        return self._render_cache
 
     def copy(self) -> "UltimateTicTacToeBoard":
         """Create a deep copy of the board."""
-        new_board = UltimateTicTacToeBoard()
-        new_board._board = self._board.copy()
+        return self.__copy__()
+
+    def __copy__(self) -> "UltimateTicTacToeBoard":
+        # Bypass __init__: all state is immutable ints and objects, so it is
+        # shared rather than copied
+        new_board = object.__new__(type(self))
         new_board._current_player = self._current_player
-        new_board._last_move = self._last_move.copy() if self._last_move else None
+        new_board._last_move = self._last_move  # Position is immutable
+        new_board._zobrist = self._zobrist
+        new_board._x_bits = self._x_bits
+        new_board._o_bits = self._o_bits
+        new_board._closed = self._closed
+        new_board._subwin_x = self._subwin_x
+        new_board._subwin_o = self._subwin_o
+        new_board._game_over = self._game_over
+        new_board._winner = self._winner
+        new_board._legal_cache = self._legal_cache
+        new_board._legal_ids_cache = self._legal_ids_cache
+        new_board._board_cache = self._board_cache
+        new_board._render_cache = self._render_cache
         return new_board
 
+    def __deepcopy__(self, memo) -> "UltimateTicTacToeBoard":
+        # Nothing is mutable (cached arrays are backed by immutable bytes),
+        # so a deep copy is the same as a shallow one
+        new_board = self.__copy__()
+        memo[id(self)] = new_board
+        return new_board
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Capture the current state as a small immutable record.
+
+        Returns:
+            BoardSnapshot that can be passed to restore() on any board
+        """
+        return BoardSnapshot(
+            self._x_bits,
+            self._o_bits,
+            _PLAYERS[self._current_player],
+            self._last_move.board_id if self._last_move is not None else None,
+        )
+
+    def restore(self, snapshot: BoardSnapshot) -> None:
+        """
+        Restore a state captured with snapshot().
+
+        Args:
+            snapshot: Snapshot to restore
+        """
+        self._current_player = snapshot.current_player.value
+        self._last_move = (
+            _ALL_POSITIONS[snapshot.last_move]
+            if snapshot.last_move is not None
+            else None
+        )
+        self._x_bits = snapshot.x_bits
+        self._o_bits = snapshot.o_bits
+        self._derive_from_bits()
+
     def get_state(self) -> Tuple[np.ndarray, np.ndarray]:
         """
         Get current board state.
@@ -331,7 +691,7 @@ class UltimateTicTacToeBoard:
             - main_board: 9x9 array representing the full board
             - meta_board: 3x3 array representing which sub-boards are won
         """
-        return self._board.copy(), self.subboard_winner.copy()
+        return self.board, self.subboard_winner
 
     @property
     def game_over(self) -> bool:
@@ -342,22 +702,7 @@ class UltimateTicTacToeBoard:
         1. A player wins 3 sub-boards in a row (horizontally, vertically, or diagonally)
         2. All sub-boards are either won or full (draw)
         """
-        # Check if either player has a winning line on the meta-board
-        for player in (Player.X, Player.O):
-            if self._check_win_pattern_for_player(self.subboard_winner, player):
-                return True
-
-        # Check for draw: all sub-boards must be either won or full
-        for i in range(3):
-            for j in range(3):
-                # If any sub-board is not won and not full, game is not over
-                if self.subboard_winner[
-                    i, j
-                ] == Player.EMPTY.value and not self._is_sub_board_full(j, i):
-                    return False
-
-        # All sub-boards are either won or full → draw
-        return True
+        return self._game_over
 
     @property
     def winner(self) -> Player:
@@ -367,22 +712,12 @@ class UltimateTicTacToeBoard:
         Returns:
             Player.X or Player.O if that player has won, Player.EMPTY otherwise
         """
-        # If the game is not yet over there is no winner
-        if not self.game_over:
-            return Player.EMPTY
-
-        # Check which player (if any) owns a winning line on the meta-board
-        for player in (Player.X, Player.O):
-            if self._check_win_pattern_for_player(self.subboard_winner, player):
-                return player
-
-        # No player has a winning line → draw
-        return Player.EMPTY
+        return _PLAYERS[self._winner]
 
     @property
     def subboard_winner(self) -> np.ndarray:
         """
-        Get the current sub-board winners.
+        Get the current sub-board winners (a new array on every access).
 
         Returns:
             3x3 array where:
@@ -390,68 +725,130 @@ class UltimateTicTacToeBoard:
             - Player.X.value: Player X won this sub-board
             - Player.O.value: Player O won this sub-board
         """
-        result = np.full((3, 3), Player.EMPTY.value, dtype=np.int8)
-
-        for grid_x, grid_y in itertools.product(range(3), range(3)):
-            # Extract sub-board data using numpy slicing
-            start_y = grid_y * 3
-            start_x = grid_x * 3
-            sub_board_data = self._board[start_y : start_y + 3, start_x : start_x + 3]
+        meta = _MASK_BITS[self._subwin_x] * _X + _MASK_BITS[self._subwin_o] * _O
+        return meta.reshape(3, 3)
 
-            # Check if X won this sub-board
-            if self._check_win_pattern_for_player(sub_board_data, Player.X):
-                result[grid_y, grid_x] = Player.X.value
-            # Check if O won this sub-board
-            elif self._check_win_pattern_for_player(sub_board_data, Player.O):
-                result[grid_y, grid_x] = Player.O.value
-            # Otherwise, sub-board is not yet won (result remains Player.EMPTY.value)
+    def _compute_zobrist(self) -> int:
+        """
+        Compute the Zobrist hash of the current state from scratch.
 
-        return result
+        Returns:
+            Hash value as a non-negative Python int
+        """
+        zobrist = 0
+        for player_value, bits in ((_X, self._x_bits), (_O, self._o_bits)):
+            while bits:
+                low_bit = bits & -bits
+                position = _SLOT_POSITIONS[low_bit.bit_length() - 1]
+                zobrist ^= _ZOBRIST[player_value][position.board_id]
+                bits ^= low_bit
+        if self._current_player == _O:
+            zobrist ^= _ZOBRIST_TURN
+        if self._last_move is not None:
+            zobrist ^= _ZOBRIST_TARGET[self._last_move.cell_id]
+        return zobrist
+
+    def _legal_bits(self) -> int:
+        """
+        Compute the bitboard of legal moves for the current player.
 
-    def _is_sub_board_full(self, grid_x: int, grid_y: int) -> bool:
+        Returns:
+            Bitboard (bit = sub_grid_id * 9 + cell_id) of empty, playable cells
         """
-        Check if a sub-board is full (no empty cells).
+        if self._last_move is None:
+            # First move: can play anywhere
+            # Assert that board is completely empty for first move
+            assert not (
+                self._x_bits | self._o_bits
+            ), "Board must be empty for first move"
+            allowed = _ALL_CELLS
+        elif not (self._closed >> self._last_move.cell_id) & 1:
+            # Must play in the sub-board corresponding to last move's cell position
+            allowed = _SUB_MASKS[self._last_move.cell_id]
+        else:
+            # Target sub-board is won or full, can play in any available sub-board
+            allowed = _OPEN_CELLS[self._closed]
 
-        Args:
-            grid_x, grid_y: Sub-grid coordinates (0-2)
+        return ~(self._x_bits | self._o_bits) & allowed
+
+    def _legal_id_mask(self) -> np.ndarray:
+        """
+        Expand the legal-move bitboard into a per-position array.
 
         Returns:
-            True if the sub-board has no empty cells, False otherwise
+            Boolean array of length 81 indexed by global position ID
         """
-        start_y = grid_y * 3
-        start_x = grid_x * 3
-        sub_board_data = self._board[start_y : start_y + 3, start_x : start_x + 3]
-        return not np.any(sub_board_data == Player.EMPTY.value)
+        return _unpack_bits(self._legal_bits()).astype(bool)
 
-    def _check_win_pattern_for_player(
-        self, board_slice: np.ndarray, player: Player
-    ) -> bool:
+    def _rebuild_state(self, board: np.ndarray) -> None:
         """
-        Check if a specific player has a winning pattern on a 3x3 board slice.
+        Rebuild all state except the current player and last move from a
+        9x9 board array.
 
         Args:
-            board_slice: 3x3 numpy array to check
-            player: Player to check for winning pattern
-
-        Returns:
-            True if the player has 3 in a row (horizontally, vertically, or diagonally)
+            board: 9x9 array (0: empty, 1: X, 2: O)
         """
-        player_value = player.value
+        # Regroup to (sub_grid_id, cell_id) and pack each sub-board per player
+        cells = (
+            np.asarray(board).reshape(3, 3, 3, 3).transpose(0, 2, 1, 3).reshape(9, 9)
+        )
+        x_masks = (cells == Player.X.value) @ _BIT_WEIGHTS
+        o_masks = (cells == Player.O.value) @ _BIT_WEIGHTS
 
-        # Check rows
-        for row in range(3):
-            if np.all(board_slice[row, :] == player_value):
-                return True
+        self._x_bits = sum(
+            mask << (9 * sub) for sub, mask in enumerate(x_masks.tolist())
+        )
+        self._o_bits = sum(
+            mask << (9 * sub) for sub, mask in enumerate(o_masks.tolist())
+        )
 
-        # Check columns
-        for col in range(3):
-            if np.all(board_slice[:, col] == player_value):
-                return True
+        # Look up all sub-board winners at once; X takes precedence as before
+        x_won = _WIN_LUT[x_masks]
+        o_won = _WIN_LUT[o_masks] & ~x_won
+        full = (x_masks | o_masks) == 0x1FF
+        self._closed = int((x_won | o_won | full) @ _BIT_WEIGHTS)
+        self._subwin_x = int(x_won @ _BIT_WEIGHTS)
+        self._subwin_o = int(o_won @ _BIT_WEIGHTS)
+        self._derive_result()
 
-        # Check diagonals
-        if np.all(np.diag(board_slice) == player_value):
-            return True
-        if np.all(np.diag(np.fliplr(board_slice)) == player_value):
-            return True
+    def _derive_from_bits(self) -> None:
+        """
+        Recompute the sub-board masks, game result, Zobrist hash and legal
+        moves from the bitboards, current player and last move.
+        """
+        # The state is already nine 9-bit fields per player, so the table is
+        # indexed directly rather than round-tripping through numpy
+        closed = subwin_x = subwin_o = 0
+        for sub in range(9):
+            x_mask = (self._x_bits >> (9 * sub)) & 0x1FF
+            o_mask = (self._o_bits >> (9 * sub)) & 0x1FF
+            # X takes precedence as before
+            if _WIN_TABLE[x_mask]:
+                subwin_x |= 1 << sub
+            elif _WIN_TABLE[o_mask]:
+                subwin_o |= 1 << sub
+            elif x_mask | o_mask != 0x1FF:
+                continue
+            closed |= 1 << sub
+        self._closed = closed
+        self._subwin_x = subwin_x
+        self._subwin_o = subwin_o
+        self._derive_result()
+
+    def _derive_result(self) -> None:
+        """
+        Recompute the game result, Zobrist hash and legal moves once the
+        bitboards and sub-board masks are set.
+        """
+        # Game result from the meta-board; X takes precedence as before
+        if _WIN_TABLE[self._subwin_x]:
+            self._winner = _X
+        elif _WIN_TABLE[self._subwin_o]:
+            self._winner = _O
+        else:
+            self._winner = _EMPTY
+        self._game_over = self._winner != _EMPTY or self._closed == 0x1FF
 
-        return False
+        self._zobrist = self._compute_zobrist()
+        self._legal_cache = None
+        self._legal_ids_cache = None
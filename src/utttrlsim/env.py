@@ -26,16 +26,22 @@ class UltimateTicTacToeEnv(gym.Env):
     Player X always trainer, Player O is an opponent (can be random or another agent).
     """
 
-    def __init__(self, render_mode: Optional[str] = None):
+    def __init__(
+        self, render_mode: Optional[str] = None, copy_observation: bool = True
+    ):
         """
         Initialize the Ultimate Tic-Tac-Toe environment.
 
         Args:
             render_mode: Rendering mode ("human", "rgb_array", or None)
+            copy_observation: If False, the observation's board array is the
+                board's shared read-only array instead of a fresh copy. It is
+                never modified after being returned, so it can be kept.
         """
         super().__init__()
 
         self.render_mode = render_mode
+        self.copy_observation = copy_observation
         self.board = UltimateTicTacToeBoard()
 
         # Action space: 81 possible moves (9 sub-boards × 9 positions)
@@ -88,7 +94,15 @@ class UltimateTicTacToeEnv(gym.Env):
 
         Returns:
             Tuple of (observation, reward, done, truncated, info)
+
+        Raises:
+            ValueError: If the action is out of range or not a legal move
         """
+        # Position only asserts its range, which python -O strips; negative
+        # actions would then silently index from the end of the table
+        if not 0 <= action < 81:
+            raise ValueError(f"Action must be 0-80, got {action}")
+
         # Store the player who made this move (before the move is made)
         current_player = self.board.current_player
 
@@ -137,8 +151,12 @@ class UltimateTicTacToeEnv(gym.Env):
               - "board": current board state (9×9 np.int8)
               - "action_mask": 1D np.uint8 array of length 81 (1 = legal)
         """
+        # board.board is already a fresh array; board_view is the board's own
+        # cached read-only array and avoids the copy
         return {
-            "board": self.board.board.copy(),
+            "board": (
+                self.board.board if self.copy_observation else self.board.board_view
+            ),
             "action_mask": self._get_action_mask(),
         }
 
@@ -150,7 +168,7 @@ class UltimateTicTacToeEnv(gym.Env):
             Dictionary containing additional info
         """
         return {
-            "meta_board": self.board.subboard_winner.copy(),
+            "meta_board": self.board.subboard_winner,
             "current_player": self.board.current_player.value,
             "legal_moves": [move.board_id for move in self.board.get_legal_moves()],
             "game_over": self.board.game_over,
@@ -201,12 +219,10 @@ class UltimateTicTacToeEnv(gym.Env):
             1 → 今打てる
             0 → 打てない（サブボードが埋まっている など）
         """
-        legal_moves = self.board.get_legal_moves()
+        # The board caches the legal IDs until its state changes, so the
+        # observation and ActionMasker share one legal-move computation
         mask = np.zeros(81, dtype=np.int8)
-
-        for position in legal_moves:
-            mask[position.board_id] = 1
-
+        mask[self.board.get_legal_move_ids()] = 1
         return mask
 
     def get_action_mask(self):
@@ -0,0 +1,307 @@
+"""
+Tests for the Ultimate Tic-Tac-Toe board.
+
+The bitboard implementation is checked against a straightforward 9x9-array
+reference implementation of the rules over many random games.
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from utttrlsim.board import Player, Position, UltimateTicTacToeBoard
+
+_LINES = (
+    ((0, 0), (0, 1), (0, 2)),
+    ((1, 0), (1, 1), (1, 2)),
+    ((2, 0), (2, 1), (2, 2)),
+    ((0, 0), (1, 0), (2, 0)),
+    ((0, 1), (1, 1), (2, 1)),
+    ((0, 2), (1, 2), (2, 2)),
+    ((0, 0), (1, 1), (2, 2)),
+    ((0, 2), (1, 1), (2, 0)),
+)
+
+
+def _has_line(grid: np.ndarray, value: int) -> bool:
+    return any(all(grid[y, x] == value for y, x in line) for line in _LINES)
+
+
+class ReferenceBoard:
+    """Array-based reference implementation of the rules."""
+
+    def __init__(self, current_player: Player = Player.X):
+        self.board = np.zeros((9, 9), dtype=np.int8)
+        self.current_player = current_player
+        self.last_move = None
+
+    def sub_board(self, grid_x: int, grid_y: int) -> np.ndarray:
+        return self.board[grid_y * 3 : grid_y * 3 + 3, grid_x * 3 : grid_x * 3 + 3]
+
+    @property
+    def subboard_winner(self) -> np.ndarray:
+        result = np.zeros((3, 3), dtype=np.int8)
+        for grid_y in range(3):
+            for grid_x in range(3):
+                sub = self.sub_board(grid_x, grid_y)
+                if _has_line(sub, Player.X.value):
+                    result[grid_y, grid_x] = Player.X.value
+                elif _has_line(sub, Player.O.value):
+                    result[grid_y, grid_x] = Player.O.value
+        return result
+
+    def _open_sub_boards(self) -> set:
+        meta = self.subboard_winner
+        return {
+            (grid_x, grid_y)
+            for grid_y in range(3)
+            for grid_x in range(3)
+            if meta[grid_y, grid_x] == 0 and np.any(self.sub_board(grid_x, grid_y) == 0)
+        }
+
+    @property
+    def winner(self) -> Player:
+        meta = self.subboard_winner
+        for player in (Player.X, Player.O):
+            if _has_line(meta, player.value):
+                return player
+        return Player.EMPTY
+
+    @property
+    def game_over(self) -> bool:
+        if self.winner != Player.EMPTY:
+            return True
+        return not self._open_sub_boards()
+
+    def legal_move_ids(self) -> list:
+        if self.last_move is None:
+            return list(range(81))
+        target = (self.last_move.cell_x, self.last_move.cell_y)
+        open_subs = self._open_sub_boards()
+        if target in open_subs:
+            open_subs = {target}
+        return [
+            board_id
+            for board_id in range(81)
+            if (Position(board_id).sub_grid_x, Position(board_id).sub_grid_y)
+            in open_subs
+            and self.board[board_id // 9, board_id % 9] == 0
+        ]
+
+    def make_move(self, board_id: int) -> None:
+        self.board[board_id // 9, board_id % 9] = self.current_player.value
+        self.last_move = Position(board_id)
+        self.current_player = Player.O if self.current_player == Player.X else Player.X
+
+
+def _reference_render(board: np.ndarray) -> str:
+    """Render a 9x9 array in the layout of UltimateTicTacToeBoard.render()."""
+    symbols = {0: ".", 1: "X", 2: "O"}
+    lines = []
+    for board_y in range(9):
+        if board_y in (3, 6):
+            lines.append("-" * 23)
+        groups = [
+            " ".join(symbols[int(cell)] for cell in board[board_y, x : x + 3])
+            for x in (0, 3, 6)
+        ]
+        lines.append(" | ".join(groups))
+    return "\n".join(lines)
+
+
+def _assert_same_state(
+    board: UltimateTicTacToeBoard, other: UltimateTicTacToeBoard
+) -> None:
+    np.testing.assert_array_equal(board.board, other.board)
+    assert board.current_player == other.current_player
+    assert board.last_move == other.last_move
+    assert board.zobrist == other.zobrist
+
+
+def _assert_matches(board: UltimateTicTacToeBoard, reference: ReferenceBoard) -> None:
+    np.testing.assert_array_equal(board.board, reference.board)
+    np.testing.assert_array_equal(board.subboard_winner, reference.subboard_winner)
+    assert board.game_over == reference.game_over
+    assert board.winner == reference.winner
+    assert board.current_player == reference.current_player
+    if not reference.game_over:
+        legal_ids = reference.legal_move_ids()
+        assert [move.board_id for move in board.get_legal_moves()] == legal_ids
+        assert board.get_legal_move_ids().tolist() == legal_ids
+
+
+class TestBaselineEquivalence:
+    @pytest.mark.parametrize("seed", range(150))
+    def test_random_game_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        first_player = Player.X if seed % 2 == 0 else Player.O
+        board = UltimateTicTacToeBoard(current_player=first_player)
+        unchecked = UltimateTicTacToeBoard(current_player=first_player)
+        reference = ReferenceBoard(current_player=first_player)
+
+        _assert_matches(board, reference)
+        while not reference.game_over:
+            legal_ids = reference.legal_move_ids()
+            illegal_ids = sorted(set(range(81)) - set(legal_ids))
+            if illegal_ids:
+                with pytest.raises(ValueError):
+                    board.make_move(Position(int(rng.choice(illegal_ids))))
+
+            move_id = int(rng.choice(legal_ids))
+            board.make_move(Position(move_id))
+            unchecked.make_move_unchecked(move_id)
+            reference.make_move(move_id)
+            _assert_matches(board, reference)
+            _assert_matches(unchecked, reference)
+            _assert_same_state(unchecked, board)
+
+            # Incremental hash matches a from-scratch hash of the same state
+            rebuilt = UltimateTicTacToeBoard(
+                board=reference.board.copy(),
+                current_player=reference.current_player,
+                last_move=reference.last_move,
+            )
+            _assert_same_state(rebuilt, board)
+
+        with pytest.raises(RuntimeError):
+            board.make_move(Position(0))
+
+
+class TestRender:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_render_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        board = UltimateTicTacToeBoard()
+        while not board.game_over:
+            rendered = board.render()
+            assert rendered == _reference_render(board.board)
+            assert board.render_lines() == rendered.split("\n")
+            board.make_move(rng.choice(board.get_legal_moves()))
+        assert board.render() == _reference_render(board.board)
+
+    def test_render_lines_is_a_new_list(self):
+        board = UltimateTicTacToeBoard()
+        lines = board.render_lines()
+        lines.clear()
+        assert len(board.render_lines()) == 11
+
+    def test_render_follows_state_changes(self):
+        board = UltimateTicTacToeBoard()
+        empty = board.render()
+
+        board.make_move(Position(40))
+        assert board.render() != empty
+        assert board.render() == _reference_render(board.board)
+
+        board.reset()
+        assert board.render() == empty
+
+        cells = np.zeros((9, 9), dtype=np.int8)
+        cells[8, 8] = Player.O.value
+        board.board = cells
+        assert board.render() == _reference_render(cells)
+
+        board.restore(UltimateTicTacToeBoard().snapshot())
+        assert board.render() == empty
+        assert board.render_lines() == empty.split("\n")
+
+
+class TestReset:
+    def test_reset_hashes_empty_board(self):
+        board = UltimateTicTacToeBoard()
+        board.make_move(Position(40))
+        board.reset()
+
+        _assert_same_state(board, UltimateTicTacToeBoard())
+
+    def test_reset_boards_stay_equal_after_moves(self):
+        board = UltimateTicTacToeBoard()
+        board.make_move(Position(40))
+        board.reset(current_player=Player.O)
+
+        fresh = UltimateTicTacToeBoard(current_player=Player.O)
+        for board_id in (40, 30, 0):
+            board.make_move(Position(board_id))
+            fresh.make_move(Position(board_id))
+            _assert_same_state(board, fresh)
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_restore_matches_original(self, seed):
+        rng = np.random.default_rng(seed)
+        board = UltimateTicTacToeBoard()
+        history = []
+        while True:
+            history.append((board.snapshot(), board.copy()))
+            if board.game_over:
+                break
+            board.make_move(rng.choice(board.get_legal_moves()))
+
+        for snapshot, expected in history:
+            restored = UltimateTicTacToeBoard()
+            restored.make_move(Position(0))
+            restored.restore(snapshot)
+            _assert_same_state(restored, expected)
+            assert restored.game_over == expected.game_over
+            assert restored.winner == expected.winner
+            np.testing.assert_array_equal(
+                restored.subboard_winner, expected.subboard_winner
+            )
+            if not expected.game_over:
+                assert restored.get_legal_moves() == expected.get_legal_moves()
+
+
+class TestMakeMoveValidation:
+    @pytest.mark.parametrize("move", [4, None, "40", (1, 1, 1, 1)])
+    def test_non_position_raises_value_error(self, move):
+        board = UltimateTicTacToeBoard()
+        assert not board.is_legal_move(move)
+        with pytest.raises(ValueError):
+            board.make_move(move)
+
+    def test_is_legal_move_matches_legal_moves(self):
+        board = UltimateTicTacToeBoard()
+        board.make_move(Position(40))
+        legal_moves = set(board.get_legal_moves())
+        for board_id in range(81):
+            position = Position(board_id)
+            assert board.is_legal_move(position) == (position in legal_moves)
+
+
+class TestCopy:
+    def test_board_view_cannot_be_made_writable(self):
+        board = UltimateTicTacToeBoard()
+        board.make_move(Position(40))
+        view = board.board_view
+        assert not view.flags.writeable
+        with pytest.raises(ValueError):
+            view.setflags(write=True)
+
+    def test_deepcopy_is_independent(self):
+        board = UltimateTicTacToeBoard()
+        board.make_move(Position(40))
+        board.board_view
+        copied = copy.deepcopy(board)
+
+        board.make_move(Position(30))
+        assert copied.board_view[4, 4] == Player.X.value
+        assert copied.board_view[3, 3] == Player.EMPTY.value
+        assert copied.get_legal_move_ids().tolist() == [
+            move.board_id for move in copied.get_legal_moves()
+        ]
+
+    def test_copy_keeps_subclass(self):
+        class CustomBoard(UltimateTicTacToeBoard):
+            pass
+
+        board = CustomBoard()
+        assert type(copy.copy(board)) is CustomBoard
+        assert type(copy.deepcopy(board)) is CustomBoard
+
+    def test_deepcopy_keeps_shared_references(self):
+        board = UltimateTicTacToeBoard()
+        pair = copy.deepcopy([board, board])
+        assert pair[0] is pair[1]
+        assert pair[0] is not board
@@ -0,0 +1,80 @@
+"""
+Tests for the Ultimate Tic-Tac-Toe Gymnasium environment.
+"""
+
+import numpy as np
+import pytest
+
+from utttrlsim.board import Position
+from utttrlsim.env import UltimateTicTacToeEnv
+
+
+def _legal_ids(env: UltimateTicTacToeEnv) -> list:
+    return sorted(move.board_id for move in env.board.get_legal_moves())
+
+
+class TestActionMask:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_mask_matches_legal_moves(self, seed):
+        env = UltimateTicTacToeEnv()
+        observation, _ = env.reset(seed=seed)
+        terminated = False
+        while not terminated:
+            legal_ids = _legal_ids(env)
+            assert np.flatnonzero(observation["action_mask"]).tolist() == legal_ids
+            assert np.flatnonzero(env.get_action_mask()).tolist() == legal_ids
+
+            action = legal_ids[seed % len(legal_ids)]
+            observation, _, terminated, _, _ = env.step(action)
+
+    def test_mask_follows_direct_board_changes(self):
+        env = UltimateTicTacToeEnv()
+        env.reset(seed=0)
+        env.get_action_mask()
+
+        env.board.make_move(env.board.get_legal_moves()[0])
+        assert np.flatnonzero(env.get_action_mask()).tolist() == _legal_ids(env)
+
+    def test_mask_is_writable_copy(self):
+        env = UltimateTicTacToeEnv()
+        env.reset(seed=0)
+        mask = env.get_action_mask()
+        mask[:] = 0
+        assert env.get_action_mask().sum() == 81
+
+
+class TestObservation:
+    def test_observation_board_matches_board(self):
+        env = UltimateTicTacToeEnv()
+        env.reset(seed=0)
+        observation, _, _, _, _ = env.step(40)
+        assert observation["board"].dtype == np.int8
+        np.testing.assert_array_equal(observation["board"], env.board.board)
+        assert env.board.last_move == Position(40)
+
+    def test_shared_board_is_read_only_and_stable(self):
+        env = UltimateTicTacToeEnv(copy_observation=False)
+        observation, _ = env.reset(seed=0)
+        first = observation["board"]
+        assert not first.flags.writeable
+        with pytest.raises(ValueError):
+            first[0, 0] = 1
+
+        observation, _, _, _, _ = env.step(40)
+        kept = observation["board"]
+        kept_values = kept.copy()
+        for action in (30, 0):
+            observation, _, _, _, _ = env.step(action)
+
+        assert not first.any()
+        np.testing.assert_array_equal(kept, kept_values)
+        np.testing.assert_array_equal(observation["board"], env.board.board)
+
+
+class TestStep:
+    def test_invalid_actions_bulk(self):
+        env = UltimateTicTacToeEnv()
+        env.reset(seed=0)
+        for action in (-1, 81, 100):
+            with pytest.raises(ValueError):
+                env.step(action)